@@ -0,0 +1,20 @@
+"""
+Settings for running the test suite against an in-memory database.
+
+Use with `python manage.py test --settings=app.test_settings` to skip
+the Postgres container; combine with --keepdb to reuse the schema
+between runs against Postgres.
+"""
+
+from app.settings import *  # noqa: F401,F403
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+# Applied unconditionally here; settings.py only swaps hashers when it
+# detects the test runner on the command line.
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
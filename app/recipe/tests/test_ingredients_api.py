@@ -1,5 +1,5 @@
 from django.contrib.auth import get_user_model
-from django.urls import reverse
+from django.urls import reverse_lazy
 from django.test import TestCase
 
 from rest_framework import status
@@ -9,7 +9,9 @@ from core.models import Ingredient
 from recipe.serializers import IngredientSerializer
 
 
-INGREDIENTS_URL = reverse('recipe:ingredient-list')
+User = get_user_model()
+
+INGREDIENTS_URL = reverse_lazy('recipe:ingredient-list')
 
 
 class PublicIngredientApiTests(TestCase):
@@ -28,18 +30,23 @@ class PublicIngredientApiTests(TestCase):
 class PrivateIngredientApiTests(TestCase):
     """Test the authenticated users ingredient API"""
 
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email='sample@gmail.com',
             password='Testpass123'
         )
+
+    def setUp(self):
         self.client = APIClient()
         self.client.force_authenticate(self.user)
 
     def test_retrieve_ingredients(self):
         """Test retrieving ingredients"""
-        Ingredient.objects.create(user=self.user, name='Ham')
-        Ingredient.objects.create(user=self.user, name='Chicken')
+        Ingredient.objects.bulk_create([
+            Ingredient(user=self.user, name='Ham'),
+            Ingredient(user=self.user, name='Chicken'),
+        ])
         res = self.client.get(INGREDIENTS_URL)
         ingredients = Ingredient.objects.all().order_by('-name')
         serializer = IngredientSerializer(ingredients, many=True)
@@ -49,7 +56,7 @@ class PrivateIngredientApiTests(TestCase):
 
     def test_ingredients_limited_to_user(self):
         """Test the ingredients are returned for authenticated user"""
-        another_user = get_user_model().objects.create_user(
+        another_user = User.objects.create_user(
             email='another@gmail.com',
             password='anotherpass123'
         )
@@ -1,5 +1,6 @@
 from django.contrib.auth import get_user_model
-from django.urls import reverse
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse, reverse_lazy
 from django.test import TestCase
 
 from rest_framework import status
@@ -8,13 +9,15 @@ from rest_framework.test import APIClient
 from core.models import Tag, Ingredient, Recipe
 from recipe.serializers import RecipeSerializer, RecipeDetailSerializer
 
+import io
 import os
-import tempfile
 
 from PIL import Image
 
 
-RECIPES_URL = reverse('recipe:recipe-list')
+User = get_user_model()
+
+RECIPES_URL = reverse_lazy('recipe:recipe-list')
 
 
 def image_upload_url(recipe_id):
@@ -62,12 +65,15 @@ class PublicRecipeApiTest(TestCase):
 class PrivateRecipeApiTest(TestCase):
     """Test the authenticated users recipe API"""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(
             email='sample@gmail.com',
             password='Testpass123'
         )
+
+    def setUp(self):
+        self.client = APIClient()
         self.client.force_authenticate(user=self.user)
 
     def test_retrieve_recipes(self):
@@ -75,14 +81,17 @@ class PrivateRecipeApiTest(TestCase):
         create_sample_recipe(user=self.user)
         create_sample_recipe(user=self.user)
         res = self.client.get(RECIPES_URL)
-        recipes = Recipe.objects.all().order_by('-id')
-        serializer = RecipeSerializer(recipes, many=True)
+        recipes = Recipe.objects.filter(user=self.user)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(
+            sorted(recipe['id'] for recipe in res.data),
+            sorted(recipe.id for recipe in recipes)
+        )
+        self.assertEqual(res.data[0]['title'], 'Sample Recipe')
 
     def test_recipes_limited_to_user(self):
-        another_user = get_user_model().objects.create_user(
+        another_user = User.objects.create_user(
             email='another@gmail.com',
             password='anotherpass123'
         )
@@ -90,9 +99,11 @@ class PrivateRecipeApiTest(TestCase):
         create_sample_recipe(user=self.user)
         res = self.client.get(RECIPES_URL)
         recipes = Recipe.objects.filter(user=self.user)
-        serializer = RecipeSerializer(recipes, many=True)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(
+            sorted(recipe['id'] for recipe in res.data),
+            sorted(recipe.id for recipe in recipes)
+        )
 
     def test_recipe_detail_view(self):
         """Test viewing a recipe's detail"""
@@ -202,26 +213,34 @@ class PrivateRecipeApiTest(TestCase):
 
 class RecipeImageUploadTests(TestCase):
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(
             email='sample@user.com',
             password='testpass'
         )
+        cls.recipe = create_sample_recipe(user=cls.user)
+        buffer = io.BytesIO()
+        Image.new('RGB', (10, 10)).save(buffer, format='JPEG')
+        cls._jpeg_bytes = buffer.getvalue()
+
+    def setUp(self):
+        self.client = APIClient()
         self.client.force_authenticate(self.user)
-        self.recipe = create_sample_recipe(user=self.user)
 
     def tearDown(self):
         self.recipe.image.delete()
 
     def test_upload_recipe_image(self):
         url = image_upload_url(self.recipe.id)
-        with tempfile.NamedTemporaryFile(suffix='.jpg') as ntf:
-            img = Image.new('RGB', (10, 10))
-            img.save(ntf, format='JPEG')
-            ntf.seek(0)
-            payload = {'image': ntf}
-            res = self.client.post(url, payload, format='multipart')
+        payload = {
+            'image': SimpleUploadedFile(
+                'test.jpg',
+                self._jpeg_bytes,
+                content_type='image/jpeg'
+            )
+        }
+        res = self.client.post(url, payload, format='multipart')
 
         self.recipe.refresh_from_db()
         self.assertEqual(res.status_code, status.HTTP_200_OK)
@@ -238,23 +257,31 @@ class RecipeImageUploadTests(TestCase):
 
 class RecipeFilterTests(TestCase):
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(
             email='sample@user.com',
             password='testpass'
         )
-        self.client.force_authenticate(self.user)
-        self.recipe1 = create_sample_recipe(user=self.user, title='recipe 1')
-        self.recipe2 = create_sample_recipe(user=self.user, title='recipe 2')
-        self.basic_recipe = create_sample_recipe(
-            user=self.user,
-            title='recipe 3'
+        Recipe.objects.bulk_create([
+            Recipe(user=cls.user, title=f'recipe {n}', time_minutes=10,
+                   price=5.00)
+            for n in (1, 2, 3)
+        ])
+        cls.recipe1, cls.recipe2, cls.basic_recipe = (
+            Recipe.objects.filter(user=cls.user).order_by('title')
         )
 
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
     def test_filter_recipe_by_tags(self):
-        tag1 = create_sample_tag(user=self.user, name='tag 1')
-        tag2 = create_sample_tag(user=self.user, name='tag 2')
+        Tag.objects.bulk_create([
+            Tag(user=self.user, name='tag 1'),
+            Tag(user=self.user, name='tag 2'),
+        ])
+        tag1, tag2 = Tag.objects.filter(user=self.user).order_by('name')
         self.recipe1.tags.add(tag1)
         self.recipe2.tags.add(tag2)
         payload = {'tags': f'{tag1.id},{tag2.id}'}
@@ -267,8 +294,13 @@ class RecipeFilterTests(TestCase):
         self.assertNotIn(serializer3.data, res.data)
 
     def test_filter_recipes_by_ingredients(self):
-        ingr1 = create_sample_ingredient(user=self.user, name='ingr 1')
-        ingr2 = create_sample_ingredient(user=self.user, name='ingr 2')
+        Ingredient.objects.bulk_create([
+            Ingredient(user=self.user, name='ingr 1'),
+            Ingredient(user=self.user, name='ingr 2'),
+        ])
+        ingr1, ingr2 = (
+            Ingredient.objects.filter(user=self.user).order_by('name')
+        )
         self.recipe1.ingredients.add(ingr1)
         self.recipe2.ingredients.add(ingr2)
         payload = {'ingredients': f'{ingr1.id},{ingr2.id}'}
@@ -1,5 +1,5 @@
 from django.contrib.auth import get_user_model
-from django.urls import reverse
+from django.urls import reverse_lazy
 from django.test import TestCase
 
 from rest_framework import status
@@ -10,7 +10,9 @@ from core.models import Tag, Recipe
 from recipe.serializers import TagSerializer
 
 
-TAGS_URL = reverse('recipe:tag-list')
+User = get_user_model()
+
+TAGS_URL = reverse_lazy('recipe:tag-list')
 
 
 class PublicTagApiTests(TestCase):
@@ -29,18 +31,23 @@ class PublicTagApiTests(TestCase):
 class PrivateTagApiTests(TestCase):
     """Test the authenticated users tags API"""
 
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email='sample@gmail.com',
             password='Testpass123'
         )
+
+    def setUp(self):
         self.client = APIClient()
         self.client.force_authenticate(self.user)
 
     def test_retrieve_tags(self):
         """Test retrieving tags"""
-        Tag.objects.create(user=self.user, name='Vegan')
-        Tag.objects.create(user=self.user, name='Dessert')
+        Tag.objects.bulk_create([
+            Tag(user=self.user, name='Vegan'),
+            Tag(user=self.user, name='Dessert'),
+        ])
         res = self.client.get(TAGS_URL)
         tags = Tag.objects.all().order_by('-name')
         serializer = TagSerializer(tags, many=True)
@@ -50,7 +57,7 @@ class PrivateTagApiTests(TestCase):
 
     def test_tags_limited_to_user(self):
         """Test the tags are returned for authenticated user"""
-        another_user = get_user_model().objects.create_user(
+        another_user = User.objects.create_user(
             email='another@gmail.com',
             password='anotherpass123'
         )
@@ -100,8 +107,11 @@ class PrivateTagApiTests(TestCase):
 
     def test_retrieve_tags_assigned_unique(self):
         """Test filtering tags by assigned returns unique items"""
-        tag1 = Tag.objects.create(user=self.user, name='tag1')
-        Tag.objects.create(user=self.user, name='tag2')
+        Tag.objects.bulk_create([
+            Tag(user=self.user, name='tag1'),
+            Tag(user=self.user, name='tag2'),
+        ])
+        tag1 = Tag.objects.get(user=self.user, name='tag1')
         recipe1 = Recipe.objects.create(
             user=self.user,
             title='recipe1',
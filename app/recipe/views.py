@@ -1,3 +1,5 @@
+from django.db.models import Exists, OuterRef
+
 from rest_framework import viewsets, mixins, status
 from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import IsAuthenticated
@@ -15,15 +17,19 @@ class BaseRecipeAttrViewSet(viewsets.GenericViewSet,
     permission_classes = (IsAuthenticated,)
     queryset = None
     serializer_class = None
+    # Recipe M2M field referencing the attribute model ('tags'/'ingredients')
+    recipe_relation = None
 
     def get_queryset(self):
         """"Return objects belong to the current user"""
         assigned_only = bool(
             int(self.request.query_params.get('assigned_only', 0))
         )
-        queryset = self.queryset
+        queryset = self.queryset.model.objects.select_related('user')
         if assigned_only:
-            queryset = queryset.filter(recipe__isnull=False).distinct()
+            queryset = queryset.filter(Exists(
+                Recipe.objects.filter(**{self.recipe_relation: OuterRef('pk')})
+            ))
         return queryset.filter(user=self.request.user).order_by('-name')
 
     def perform_create(self, serializer):
@@ -33,21 +39,24 @@ class BaseRecipeAttrViewSet(viewsets.GenericViewSet,
 
 class TagViewSet(BaseRecipeAttrViewSet):
     """Manage tags in the database"""
-    queryset = Tag.objects.all()
+    queryset = Tag.objects.none()
     serializer_class = serializers.TagSerializer
+    recipe_relation = 'tags'
 
 
 class IngredientViewSet(BaseRecipeAttrViewSet):
     """Manage ingredients in the database"""
-    queryset = Ingredient.objects.all()
+    queryset = Ingredient.objects.none()
     serializer_class = serializers.IngredientSerializer
+    recipe_relation = 'ingredients'
 
 
 class RecipeViewSet(viewsets.ModelViewSet):
-    queryset = Recipe.objects.all()
+    queryset = Recipe.objects.none()
     # serializer_class = serializers.RecipeSerializer
     authentication_classes = (TokenAuthentication,)
     permission_classes = (IsAuthenticated,)
+    http_method_names = ['get', 'post', 'patch', 'put', 'delete']
 
     def _params_to_ints(self, qs):
         return [int(str_id) for str_id in qs.split(',')]
@@ -56,15 +65,24 @@ class RecipeViewSet(viewsets.ModelViewSet):
         """Return objects belong to the current user"""
         tags = self.request.query_params.get('tags')
         ingredients = self.request.query_params.get('ingredients')
-        queryset = self.queryset
+        queryset = Recipe.objects.select_related('user')
         if tags:
             tag_ids = self._params_to_ints(tags)
             queryset = queryset.filter(tags__id__in=tag_ids)
         if ingredients:
             ingredient_ids = self._params_to_ints(ingredients)
             queryset = queryset.filter(ingredients__id__in=ingredient_ids)
-
-        return queryset.filter(user=self.request.user)
+        if tags or ingredients:
+            queryset = queryset.distinct()
+
+        queryset = queryset.filter(
+            user=self.request.user
+        ).prefetch_related('tags', 'ingredients')
+        if self.action == 'list':
+            queryset = queryset.only(
+                'id', 'title', 'time_minutes', 'price', 'link', 'user'
+            )
+        return queryset
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
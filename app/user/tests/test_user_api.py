@@ -1,19 +1,21 @@
 from django.test import TestCase
 from django.contrib.auth import get_user_model
-from django.urls import reverse
+from django.urls import reverse_lazy
 
 from rest_framework import status
 from rest_framework.test import APIClient
 
 
-CREATE_USER_URL = reverse('user:create')
-GET_TOKEN_URL = reverse('user:token')
-ME_URL = reverse('user:me')
+User = get_user_model()
+
+CREATE_USER_URL = reverse_lazy('user:create')
+GET_TOKEN_URL = reverse_lazy('user:token')
+ME_URL = reverse_lazy('user:me')
 
 
 def create_user(**params):
     """Helper function to create new user"""
-    return get_user_model().objects.create_user(**params)
+    return User.objects.create_user(**params)
 
 
 class PublicUserApiTests(TestCase):
@@ -32,7 +34,7 @@ class PublicUserApiTests(TestCase):
         res = self.client.post(CREATE_USER_URL, payload)
 
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
-        user = get_user_model().objects.get(**res.data)
+        user = User.objects.get(**res.data)
         self.assertTrue(user.check_password(payload['password']))
         self.assertNotIn('password', res.data)
 
@@ -58,7 +60,7 @@ class PublicUserApiTests(TestCase):
         res = self.client.post(CREATE_USER_URL, payload)
 
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
-        user_exists = get_user_model().objects.filter(
+        user_exists = User.objects.filter(
             email=payload['email']
         ).exists()
         self.assertFalse(user_exists)
@@ -111,12 +113,15 @@ class PublicUserApiTests(TestCase):
 class PrivateUserApiTests(TestCase):
     """Test API requests that require authentication"""
 
-    def setUp(self):
-        self.user = create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email='sample@gmail.com',
             password='Testpass123',
             name='Private user'
         )
+
+    def setUp(self):
         self.client = APIClient()
         self.client.force_authenticate(user=self.user)
 